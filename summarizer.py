@@ -1,14 +1,17 @@
 import os
+import re
 import fire
-import string
-import chardet
 from typing import Union
-from heapq import nlargest
-from langdetect import detect
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer
-from nltk.tokenize import sent_tokenize, word_tokenize
-from sklearn.feature_extraction.text import TfidfVectorizer
+from functools import lru_cache, partial
+from collections import Counter
+from multiprocessing import Pool
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from queue import Queue
+
+# NLTK, NumPy, scipy, chardet and langdetect are imported lazily inside the
+# functions that need them, so the CLI does not pay their import cost just to
+# parse arguments or print help.
 
 # A frozenset containing the supported languages for text summarization.
 LANG = frozenset(["en", "ru"])
@@ -18,73 +21,278 @@ BUFFER_LIMIT = 1000
 ALLOWED_FILE_EXTENTIONS = frozenset([".txt"])
 # A float value between 0 and 1 representing the percentage of sentences to be included in the summary.
 CONTENT_AMOUNT = 0.3
+# A compiled pattern matching alphanumeric tokens, used to tokenize sentences in a single pass.
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+# A mapping from language identifiers to the NLTK stopword/tokenizer language names.
+_LANG_MAP = {'ru': 'russian',
+             'en': 'english'}
 
 
-class Summarizer:
+@lru_cache(maxsize=1)
+def _get_encoding_detector():
     """
-    This class provides methods for text summarization using Luhn's Heuristic Method.
+    Picks the fastest available encoding detection function on first use.
+
+    Prefers the C-accelerated cchardet, then the optimized
+    charset_normalizer, falling back to pure-Python chardet; all three
+    expose the same detect() API.
+
+    Returns:
+        Callable: The detect function of the chosen library.
+
     """
+    try:
+        from cchardet import detect
+    except ImportError:
+        try:
+            from charset_normalizer import detect
+        except ImportError:
+            from chardet import detect
+    return detect
 
-    def __init__(self) -> None:
-        pass
 
-    def __select_stopword_lang(self, lang) -> str:
-        """
-        Selects the appropriate stopword language based on the input language.
+@lru_cache(maxsize=1)
+def _get_stemmer():
+    """
+    Creates the shared Porter stemmer instance on first use.
 
-        Parameters:
-            lang (str): The language identifier.
+    Returns:
+        PorterStemmer: The shared stemmer.
 
-        Returns:
-            str: The corresponding stopword language.
+    """
+    from nltk.stem import PorterStemmer
+    return PorterStemmer()
 
-        """
-        languages = { 'ru' : 'russian',
-                      'en' : 'english'}
-        if lang not in languages.keys():
-            return languages['en']
-        return languages[lang]
 
-    def __luhn_summarizer(self, text, num_sentences, lang: Union["en", "ru"]) -> str:
-        """
-        Generates a summary of the given text using Luhn's Heuristic Method.
+@lru_cache(maxsize=50000)
+def _stem(word):
+    """
+    Stems the given word, caching the result for repeated tokens.
 
-        Parameters:
-            text (str): The input text to be summarized.
-            num_sentences (int): The desired number of sentences in the summary.
-            lang (str): The language of the input text.
+    Parameters:
+        word (str): The token to stem.
 
-        Returns:
-            str: The generated summary.
+    Returns:
+        str: The stemmed token.
 
-        Raises:
-            NotImplementedError: If the language is not supported.
+    """
+    return _get_stemmer().stem(word)
 
-        """
-        if lang not in LANG:
-            raise NotImplementedError('Wrong language')
 
-        # Preprocessing the text
-        stopwords_lang = self.__select_stopword_lang(lang)
-        sentences = sent_tokenize(text)
-        stemmer = PorterStemmer()
-        stop_words = list(stopwords.words(stopwords_lang))
-        vectorizer = TfidfVectorizer(stop_words=stop_words, tokenizer=word_tokenize)
+@lru_cache(maxsize=4)
+def _get_sent_tokenizer(lang='english'):
+    """
+    Loads the Punkt sentence tokenizer for the given language, caching it per language.
 
-        # Calculating TF-IDF scores for the sentences
-        sentence_scores = {}
-        for i, sentence in enumerate(sentences):
-            # Remove punctuation and convert to lowercase
-            sentence = sentence.translate(str.maketrans('', '', string.punctuation)).lower()
-            stemmed_sentence = ' '.join([stemmer.stem(word) for word in word_tokenize(sentence) if word.isalnum()])
-            sentence_scores[i] = vectorizer.fit_transform([stemmed_sentence]).sum()
+    Parameters:
+        lang (str): The tokenizer language name, e.g. 'english'.
 
-        # Selecting the most important sentences
-        selected_sentences = nlargest(num_sentences, sentence_scores, key=sentence_scores.get)
+    Returns:
+        PunktSentenceTokenizer: The loaded sentence tokenizer.
+
+    """
+    import nltk.data
+    return nltk.data.load(f'tokenizers/punkt/{lang}.pickle')
+
+
+@lru_cache(maxsize=4)
+def _get_stopwords(lang):
+    """
+    Loads the NLTK stopword list for the given stopword language, caching it per language.
+
+    Parameters:
+        lang (str): The stopword language name, e.g. 'english'.
+
+    Returns:
+        frozenset: The stopwords for the language.
+
+    """
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words(lang))
+
+
+def _tfidf_sentence_scores(token_lists, stop_words) -> 'np.ndarray':
+    """
+    Computes a TF-IDF score for every sentence from its token list.
+
+    The term-document matrix is built directly as a scipy CSR matrix and the
+    smoothed IDF weights are computed in NumPy, so all inner loops run as
+    C-level sparse/dense operations.
+
+    Parameters:
+        token_lists (list): A list with the stemmed tokens of every sentence.
+        stop_words (frozenset): The stopwords to exclude from scoring.
+
+    Returns:
+        np.ndarray: The TF-IDF score of every sentence.
+
+    """
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+    # Assigning every unique token an integer id while building the CSR arrays
+    vocabulary = {}
+    indptr = [0]
+    indices = []
+    data = []
+    for tokens in token_lists:
+        counts = Counter(token for token in tokens if token not in stop_words)
+        for token, count in counts.items():
+            indices.append(vocabulary.setdefault(token, len(vocabulary)))
+            data.append(count)
+        indptr.append(len(indices))
+
+    if not vocabulary:
+        return np.zeros(len(token_lists), dtype=np.float32)
+
+    # float32 halves the memory traffic of the sparse ops without affecting the ranking
+    tf = csr_matrix((data, indices, indptr), shape=(len(token_lists), len(vocabulary)), dtype=np.float32)
+
+    # Sublinear term frequency (1 + log(tf)) dampens very frequent terms
+    tf.data = 1.0 + np.log(tf.data)
+
+    # Smoothed IDF, matching sklearn's formulation
+    df = np.bincount(tf.indices, minlength=len(vocabulary))
+    idf = (np.log((1 + tf.shape[0]) / (1 + df)) + 1).astype(np.float32)
+
+    tf_idf = tf.multiply(idf)
+    return np.asarray(tf_idf.sum(axis=1)).ravel()
+
+
+def _luhn_summarizer(text, num_sentences, lang: Union["en", "ru"]) -> str:
+    """
+    Generates a summary of the given text using Luhn's Heuristic Method.
 
-        # Joining the selected sentences to create the summary
-        summary = ' '.join([sentences[i] for i in selected_sentences])
-        return summary
+    Parameters:
+        text (str): The input text to be summarized.
+        num_sentences (int): The desired number of sentences in the summary.
+        lang (str): The language of the input text.
+
+    Returns:
+        str: The generated summary.
+
+    Raises:
+        NotImplementedError: If the language is not supported.
+
+    """
+    if lang not in LANG:
+        raise NotImplementedError('Wrong language')
+
+    # Preprocessing the text
+    stopwords_lang = _LANG_MAP.get(lang, 'english')
+    tokenizer = _get_sent_tokenizer(stopwords_lang)
+
+    # Paragraph breaks are guaranteed sentence boundaries, so the paragraphs
+    # can be tokenized concurrently without mis-splitting at chunk edges
+    chunks = [chunk for chunk in text.split('\n\n') if chunk and not chunk.isspace()]
+    if len(chunks) > 1:
+        with ThreadPoolExecutor() as executor:
+            sentences = [sentence
+                         for chunk_sentences in executor.map(tokenizer.tokenize, chunks)
+                         for sentence in chunk_sentences]
+    else:
+        sentences = tokenizer.tokenize(text)
+
+    # Short buffers need no scoring: every sentence ends up in the summary anyway
+    if num_sentences >= len(sentences):
+        return ' '.join(sentences)
+
+    import numpy as np
+
+    # Preprocessing every sentence: lowercase, tokenize and stem in a single regex pass
+    token_lists = [[_stem(word) for word in _TOKEN_RE.findall(sentence.lower())]
+                   for sentence in sentences]
+
+    # Calculating TF-IDF scores for the sentences in a single batch,
+    # so the IDF weights are computed over the whole buffer
+    scores = _tfidf_sentence_scores(token_lists, _get_stopwords(stopwords_lang))
+
+    # Selecting the most important sentences, keeping their original order
+    top = min(num_sentences, len(scores))
+    selected_sentences = np.argpartition(-scores, top - 1)[:top]
+    selected_sentences.sort()
+
+    # Joining the selected sentences to create the summary
+    summary = ' '.join([sentences[i] for i in selected_sentences])
+    return summary
+
+
+def _luhn_worker(buffer, lang) -> str:
+    """
+    Summarizes a single buffer of text. Kept at module level so it can be
+    pickled and dispatched to worker processes.
+
+    Parameters:
+        buffer (str): The buffered lines to summarize.
+        lang (str): The language of the input text.
+
+    Returns:
+        str: The generated summary.
+
+    """
+    senences_amount = int(CONTENT_AMOUNT * buffer.count('\n'))
+    if senences_amount <= 0:
+        senences_amount = 1
+    return _luhn_summarizer(buffer, senences_amount, lang)
+
+
+def _iter_buffers(file, encoding):
+    """
+    Yields buffers of roughly BUFFER_LIMIT lines read from the given binary file.
+
+    The file is read in 64KB blocks and newlines are counted with bytes.count,
+    so the threshold check runs as a vectorized C scan instead of a Python-level
+    loop over lines; a buffer is decoded only once it is ready to be summarized.
+
+    Parameters:
+        file (BinaryIO): The open input file.
+        encoding (str): The encoding used to decode completed buffers.
+
+    Yields:
+        str: The next buffer of lines.
+
+    """
+    import codecs
+
+    # An incremental decoder carries partial code units (and a leading BOM)
+    # across buffer boundaries, so splitting at raw 0x0A bytes stays safe
+    # for multi-byte-unit encodings such as UTF-16
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    buffer = bytearray()
+    newlines = 0
+    while True:
+        block = file.read(65536)
+        if not block:
+            break
+
+        # Accumulate the block and count its newlines in one C-level pass
+        buffer += block
+        newlines += block.count(b'\n')
+
+        # Check if buffer size exceeds a threshold (e.g., 1000 lines)
+        if newlines > BUFFER_LIMIT:
+            # Split after the last complete line and carry the tail over
+            split = buffer.rfind(b'\n') + 1
+            text = decoder.decode(buffer[:split])
+            if text:
+                yield text
+            del buffer[:split]
+            newlines = 0
+
+    # Yield the remaining lines in the buffer
+    text = decoder.decode(buffer, final=True)
+    if text:
+        yield text
+
+
+class Summarizer:
+    """
+    This class provides methods for text summarization using Luhn's Heuristic Method.
+    """
+
+    def __init__(self) -> None:
+        pass
 
     def __summary_file(self, file_path, lang, encoding) -> None:
         """
@@ -101,39 +309,49 @@ class Summarizer:
         """
         if lang not in LANG:
             raise NotImplementedError('Wrong language')
-        # Open the input file
-        with open(file_path, 'r', encoding=encoding) as file:
-            # Open a new file to write the summary
-            with open(file_path.replace('.txt', '_abstract.txt'), 'w', encoding=encoding) as summary_file:
-                buffer = ""
-                for line in file:
-                    # Accumulate lines in the buffer
-                    buffer += line
-
-                    # Check if buffer size exceeds a threshold (e.g., 1000 lines)
-                    if buffer.count('\n') > BUFFER_LIMIT:
-                        # Preprocess and summarize the buffer
-                        senences_amount = int(CONTENT_AMOUNT * buffer.count('\n'))
-                        if senences_amount <= 0:
-                            senences_amount = 1
-                        summary = self.__luhn_summarizer(buffer, senences_amount, lang)
-
-                        # Write the summary to the output file
-                        summary_file.write(summary + '\n')
-
-                        # Reset the buffer
-                        buffer = ""
-
-                # Process the remaining lines in the buffer
-                if buffer:
-                    # Preprocess and summarize the remaining buffer
-                    senences_amount = int(CONTENT_AMOUNT * buffer.count('\n'))
-                    if senences_amount <= 0:
-                        senences_amount = 1
-                    summary = self.__luhn_summarizer(buffer, senences_amount, lang)
-
-                    # Write the summary to the output file
-                    summary_file.write(summary + '\n')
+        # Open the input file in binary mode; buffers are decoded when complete
+        with open(file_path, 'rb') as file:
+            # Open a new file to write the summary, with a 1MB write buffer;
+            # text mode keeps newline and BOM handling correct for any encoding
+            with open(file_path.replace('.txt', '_abstract.txt'), 'w', encoding=encoding, buffering=1 << 20) as summary_file:
+                # Read buffers on a separate thread through a bounded queue,
+                # so disk I/O overlaps with the summarization work
+                queue = Queue(maxsize=4)
+
+                def read_buffers():
+                    try:
+                        for buffer in _iter_buffers(file, encoding):
+                            queue.put(buffer)
+                    except Exception as error:
+                        # Hand the failure to the consumer instead of dying silently
+                        queue.put(error)
+                    finally:
+                        # Always signal the end of the buffer stream,
+                        # so the consumer can never block forever
+                        queue.put(None)
+
+                def iter_queue():
+                    for item in iter(queue.get, None):
+                        # Re-raise reader failures on the consuming side
+                        if isinstance(item, Exception):
+                            raise item
+                        yield item
+
+                reader = Thread(target=read_buffers, daemon=True)
+                reader.start()
+
+                # Summarize the buffers in parallel, one worker per core minus one;
+                # buffers are independent, so they form an embarrassingly parallel stream
+                processes = max(1, (os.cpu_count() or 2) - 1)
+                with Pool(processes=processes) as pool:
+                    summaries = pool.imap(partial(_luhn_worker, lang=lang), iter_queue(), chunksize=2)
+                    for summary in summaries:
+                        # Write the summaries to the output file in arrival order;
+                        # summary and newline go out separately to avoid a concatenated temporary
+                        summary_file.write(summary)
+                        summary_file.write('\n')
+
+                reader.join()
 
     def __get_file_extension(self, file_path) -> str:
         """
@@ -174,63 +392,34 @@ class Summarizer:
             str: The detected language.
 
         """
+        from langdetect import detect
         lang = detect(message)
         if lang not in LANG:
             lang = 'en'
         return lang
 
-    def __get_message_encoding(self, message) -> str:
-        """
-        Detects the encoding of the given text message.
-
-        Parameters:
-            message (str): The input text message.
-
-        Returns:
-            str: The detected encoding.
-
+    def __get_first_line(self, file_path) -> tuple:
         """
-        return chardet.detect(message.encode())['encoding']
-
-    def __get_first_line(self, file_path) -> str:
-        """
-        Retrieves the first line of the given file.
+        Retrieves the first line of the given file along with its encoding.
 
         Parameters:
             file_path (str): The path to the file.
 
         Returns:
-            str: The first line of the file.
+            tuple: The first line of the file and the detected encoding.
 
         """
+        # Read a single bounded block instead of whole lines
         with open(file_path, 'rb') as file:
-            for line in file:
-                # Flag to track if the line has been successfully decoded
-                decoded = False
-
-                # Detect the encoding of the line
-                result = chardet.detect(line)
-                encoding = result['encoding']
-
-                # List of encodings to try
-                encodings_to_try = [encoding, 'utf-8', 'latin-1']
-
-                for encoding_to_try in encodings_to_try:
-                    try:
-                        # Decode the line using the current encoding
-                        decoded_line = line.decode(encoding_to_try)
-                        decoded_line = decoded_line.strip()
-                        decoded = True
-                        if decoded_line:
-                            return decoded_line
-
-                    except UnicodeDecodeError:
-                        print(f"Error decoding line in {encoding_to_try} encoding")
+            head = file.read(4096)
 
-                # Check if the line was successfully decoded
-                if not decoded:
-                    # Handle the situation when none of the encodings worked
-                    print("Unable to decode the line with any of the encodings")
+        # Detect the encoding once on the block and decode it once
+        encoding = _get_encoding_detector()(head)['encoding'] or 'utf-8'
+        for line in head.decode(encoding, errors='replace').splitlines():
+            line = line.strip()
+            if line:
+                return line, encoding
+        return None, encoding
 
     def process_file(self, file_path) -> None:
         """
@@ -246,9 +435,8 @@ class Summarizer:
 
             if not self.__allowed_extenstion(file_path):
                 raise ValueError("Wrong extenstion")
-            line = self.__get_first_line(file_path)
+            line, encoding = self.__get_first_line(file_path)
             lang = self.__get_message_lang(line)
-            encoding = self.__get_message_encoding(line)
             self.__summary_file(file_path, lang, encoding)
         except Exception as e:
             print(e)